@@ -0,0 +1,34 @@
+import hashlib
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+"""
+Authentication Backends
+This module provides the JWT authentication class used by the REST API.
+CachedJWTAuthentication:
+    - Validates access tokens locally (signature + expiry) like SimpleJWT's JWTAuthentication
+    - Caches validated tokens by hash so repeat requests skip signature verification
+    - Loads the user lazily, so endpoints that never touch request.user skip the user query
+Cache entries never outlive the token itself, and are capped at TOKEN_CACHE_TIMEOUT seconds.
+"""
+
+TOKEN_CACHE_TIMEOUT = 30
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_validated_token(self, raw_token):
+        cache_key = 'jwt:' + hashlib.sha256(raw_token).hexdigest()
+        validated_token = cache.get(cache_key)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            remaining = int(validated_token['exp'] - timezone.now().timestamp())
+            timeout = min(remaining, TOKEN_CACHE_TIMEOUT)
+            if timeout > 0:
+                cache.set(cache_key, validated_token, timeout)
+        return validated_token
+
+    def get_user(self, validated_token):
+        # User lookup and is_active checks still run, on first access to request.user
+        load_user = super().get_user
+        return SimpleLazyObject(lambda: load_user(validated_token))
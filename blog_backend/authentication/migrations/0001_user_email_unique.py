@@ -0,0 +1,20 @@
+from django.db import migrations
+
+# auth.User does not enforce unique emails, so the constraint is added here.
+# Blank emails are allowed (registration does not require one) and stay
+# outside the index. Existing duplicate non-blank emails must be resolved
+# before this migration can be applied.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX auth_user_email_unique ON auth_user (email) WHERE email <> ''",
+            'DROP INDEX auth_user_email_unique',
+        ),
+    ]
@@ -1,3 +1,77 @@
 from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from blog_api.models import Post
 
-# Create your tests here.
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        access = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_authenticated_request(self):
+        for _ in range(2):
+            response = self.client.get('/api/posts/user/')
+            self.assertEqual(response.status_code, 200)
+
+    def test_public_endpoint_skips_user_lookup(self):
+        Post.objects.create(title='Post', content='Test content', author=self.user)
+        # ETag aggregates + count + posts only; the token's user is never loaded
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/posts/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_inactive_user_is_rejected(self):
+        self.client.get('/api/posts/user/')
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get('/api/posts/user/')
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalid_token_is_rejected(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer not-a-token')
+        response = self.client.get('/api/posts/')
+        self.assertEqual(response.status_code, 401)
+
+class EmailUniquenessTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', email='test@example.com', password='testpass123')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass123')
+
+    def test_update_email(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put('/api/profile/update/', {'email': 'new@example.com'})
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'new@example.com')
+
+    def test_update_to_taken_email(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put('/api/profile/update/', {'email': 'other@example.com'})
+        self.assertEqual(response.status_code, 400)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'test@example.com')
+
+    def test_register_with_taken_email(self):
+        response = self.client.post('/api/auth/register/', {
+            'username': 'newuser',
+            'email': 'other@example.com',
+            'password': 'Str0ng-passw0rd',
+            'password_confirm': 'Str0ng-passw0rd'
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.data)
+
+    def test_blank_emails_are_not_unique(self):
+        User.objects.create_user(username='blank1', password='testpass123')
+        User.objects.create_user(username='blank2', password='testpass123')
+        self.assertEqual(User.objects.filter(email='').count(), 2)
@@ -8,8 +8,10 @@ This class customizes the admin interface for the Post model.
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'created_at', 'updated_at']
-    list_filter = ['author', 'created_at']
-    search_fields = ['title', 'content']
+    list_filter = ['created_at']
+    list_select_related = ['author']
+    raw_id_fields = ['author']
+    search_fields = ['title', 'content', 'author__username']
     readonly_fields = ['created_at', 'updated_at']
 
 """
@@ -19,6 +21,11 @@ This class customizes the admin interface for the Comment model.
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['post', 'author', 'created_at']
-    list_filter = ['post', 'author']
-    search_fields = ['content']
-    readonly_fields = ['created_at']
\ No newline at end of file
+    list_filter = ['created_at']
+    list_select_related = ['post', 'author']
+    raw_id_fields = ['post', 'author']
+    search_fields = ['content', 'post__title', 'author__username']
+    readonly_fields = ['created_at']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('post', 'author')
\ No newline at end of file
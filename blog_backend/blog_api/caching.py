@@ -0,0 +1,43 @@
+import hashlib
+import time
+from django.core.cache import cache
+
+"""
+Short-lived caching for public user profile responses.
+Profile entries are keyed by username and page. Usernames come straight from the
+URL, so they are hashed to keep keys short and safe for any cache backend. Each
+username also has a version key that is folded into the entry keys, so bumping it
+invalidates every cached page for that user at once without having to enumerate keys.
+A global posts version is folded into the ETags of the public post endpoints. It is
+bumped on post, comment and user changes, and expires after POSTS_VERSION_TIMEOUT so
+changes it never hears about (bulk updates, writes handled by another worker with a
+per-process cache) still reach clients within that time.
+"""
+
+USER_PROFILE_CACHE_TIMEOUT = 30
+POSTS_VERSION_KEY = 'posts:version'
+POSTS_VERSION_TIMEOUT = 60
+
+def _username_hash(username):
+    return hashlib.md5(username.encode()).hexdigest()
+
+def _user_profile_version_key(username):
+    return f'userprofile:{_username_hash(username)}:version'
+
+def user_profile_cache_key(username, page_number):
+    version = cache.get(_user_profile_version_key(username), 0)
+    return f'userprofile:{_username_hash(username)}:{version}:{page_number}'
+
+def invalidate_user_profile_cache(username):
+    cache.set(_user_profile_version_key(username), time.time_ns(), None)
+
+def posts_version():
+    version = cache.get(POSTS_VERSION_KEY)
+    if version is None:
+        # Start from a fresh value rather than 0, so an emptied cache never repeats an old ETag
+        cache.add(POSTS_VERSION_KEY, time.time_ns(), POSTS_VERSION_TIMEOUT)
+        version = cache.get(POSTS_VERSION_KEY)
+    return version
+
+def bump_posts_version():
+    cache.set(POSTS_VERSION_KEY, time.time_ns(), POSTS_VERSION_TIMEOUT)
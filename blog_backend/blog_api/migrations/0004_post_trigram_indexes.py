@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# Trigram GIN indexes let Postgres serve the post search icontains lookups, which
+# compile to UPPER(column) LIKE UPPER(%s), without a sequential scan. They are
+# Postgres-only, so other backends skip them.
+TRIGRAM_INDEXES = [
+    ('blog_api_post_title_trgm', 'title'),
+    ('blog_api_post_content_trgm', 'content'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON blog_api_post '
+            f'USING gin (UPPER({column}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_api', '0003_post_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
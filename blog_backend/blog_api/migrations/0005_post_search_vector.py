@@ -0,0 +1,66 @@
+# Generated by Django 4.2.5 on 2026-10-15 01:57
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# On Postgres, search_vector is kept in sync by a trigger (title weighted above
+# content) and indexed with GIN for post search. Other backends leave it null.
+CREATE_SEARCH_VECTOR_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION blog_api_post_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER blog_api_post_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, content ON blog_api_post
+    FOR EACH ROW EXECUTE FUNCTION blog_api_post_search_vector_update()
+    """,
+    """
+    UPDATE blog_api_post SET search_vector =
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B')
+    """,
+    'CREATE INDEX blog_api_post_search_vector_gin ON blog_api_post USING gin (search_vector)',
+]
+
+DROP_SEARCH_VECTOR_SQL = [
+    'DROP INDEX IF EXISTS blog_api_post_search_vector_gin',
+    'DROP TRIGGER IF EXISTS blog_api_post_search_vector_trigger ON blog_api_post',
+    'DROP FUNCTION IF EXISTS blog_api_post_search_vector_update()',
+]
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in CREATE_SEARCH_VECTOR_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in DROP_SEARCH_VECTOR_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_api', '0004_post_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+    ]
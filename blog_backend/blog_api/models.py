@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 
 class Post(models.Model):
     """
@@ -13,10 +14,14 @@ class Post(models.Model):
         author (ForeignKey): Reference to the User who created the post.
         created_at (DateTimeField): Timestamp when the post was created (auto-set).
         updated_at (DateTimeField): Timestamp when the post was last modified (auto-updated).
+        search_vector (SearchVectorField): Weighted full-text vector of title and content,
+                                           maintained by a database trigger on Postgres.
     Properties:
-        comments_count (int): Returns the total number of comments on this post.
+        comments_count (int): Returns the total number of comments on this post,
+                              using the `_comments_count` annotation when present.
     Meta:
         ordering: Posts are ordered by creation date in descending order.
+        indexes: Newest-first listing, globally and per author.
     Returns:
         str: The string representation returns the post title.
     """
@@ -25,15 +30,23 @@ class Post(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='posts')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['author', '-created_at']),
+        ]
 
     def __str__(self):
         return self.title
 
     @property
     def comments_count(self):
+        annotated = getattr(self, '_comments_count', None)
+        if annotated is not None:
+            return annotated
         return self.comments.count()
 
 class Comment(models.Model):
@@ -53,6 +66,7 @@ class Comment(models.Model):
                                    Automatically updated on each save.
     Meta:
         ordering: Comments are ordered by creation date (oldest first).
+        indexes: Per-post listing in creation order.
     Methods:
         __str__: Returns a string representation showing the comment author and post title.
     Related Names:
@@ -67,6 +81,9 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['post', 'created_at']),
+        ]
 
     def __str__(self):
         return f'Comment by {self.author.username} on {self.post.title}'
\ No newline at end of file
@@ -0,0 +1,28 @@
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+"""
+Pagination classes for the blog API.
+StandardResultsSetPagination is the API's default pagination class. It extends
+DRF's page number pagination with the page metadata the frontend reads
+(total_pages, current_page, has_next, has_previous).
+"""
+
+class StandardResultsSetPagination(PageNumberPagination):
+    def get_paginated_data(self, data):
+        paginator = self.page.paginator
+        total_pages = paginator.num_pages
+        current_page = self.page.number
+        return {
+            'count': paginator.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'total_pages': total_pages,
+            'current_page': current_page,
+            'has_next': current_page < total_pages,
+            'has_previous': current_page > 1,
+            'results': data
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
@@ -1,8 +1,43 @@
+from copy import copy
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Post, Comment
 
-class UserSerializer(serializers.ModelSerializer):
+CONTENT_PREVIEW_LENGTH = 200
+
+class CachedFieldsMixin:
+    """
+    Mixin that caches the fields built by `get_fields()` per serializer class.
+
+    ModelSerializer rebuilds (and deep-copies) its fields on every instantiation,
+    which adds up for nested serializers in list responses. The fields are built
+    once per class and each instance receives shallow copies, so binding a field
+    to its parent never touches the cached template.
+
+    Note:
+        Nested `many=True` serializers also get a copy of their `child` so that
+        it is bound to the copied list serializer rather than the template.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in CachedFieldsMixin._fields_cache:
+            CachedFieldsMixin._fields_cache[cls] = super().get_fields()
+        return {
+            name: self._copy_field(field)
+            for name, field in CachedFieldsMixin._fields_cache[cls].items()
+        }
+
+    @staticmethod
+    def _copy_field(field):
+        field = copy(field)
+        if isinstance(field, serializers.ListSerializer):
+            field.child = copy(field.child)
+            field.child.parent = field
+        return field
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the User model.
 
@@ -22,7 +57,7 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'email']
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Comment model instances.
     This serializer handles the serialization and deserialization of Comment objects,
@@ -45,7 +80,7 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ['id', 'content', 'author', 'created_at', 'updated_at']
         read_only_fields = ['id', 'author', 'created_at', 'updated_at']
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Post model.
     This serializer handles the serialization and deserialization of Post instances,
@@ -72,4 +107,39 @@ class PostSerializer(serializers.ModelSerializer):
     class Meta:
         model = Post
         fields = ['id', 'title', 'content', 'author', 'created_at', 'updated_at', 'comments', 'comments_count']
-        read_only_fields = ['id', 'author', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'author', 'created_at', 'updated_at']
+
+class PostListSerializer(PostSerializer):
+    """
+    Lightweight Post serializer for list endpoints.
+    Omits the nested comments, exposing only comments_count, and replaces the
+    full content with content_preview (truncated to CONTENT_PREVIEW_LENGTH
+    characters, with a trailing ellipsis when cut). The preview is read from the
+    `_content_preview` annotation when present so list queries can skip the
+    content column. Use PostSerializer where the full post is needed.
+    Authors are serialized once per serializer instance and reused, so a page
+    with many posts by the same user only serializes that user once.
+    """
+    author = serializers.SerializerMethodField()
+    content_preview = serializers.SerializerMethodField()
+
+    class Meta(PostSerializer.Meta):
+        fields = ['id', 'title', 'content_preview', 'author', 'created_at', 'updated_at', 'comments_count']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # With many=True the same child serializer handles every row of the list
+        self._author_cache = {}
+
+    def get_author(self, obj):
+        if obj.author_id not in self._author_cache:
+            self._author_cache[obj.author_id] = UserSerializer(obj.author, context=self.context).data
+        return self._author_cache[obj.author_id]
+
+    def get_content_preview(self, obj):
+        content = getattr(obj, '_content_preview', None)
+        if content is None:
+            content = obj.content
+        if len(content) > CONTENT_PREVIEW_LENGTH:
+            return content[:CONTENT_PREVIEW_LENGTH] + '...'
+        return content
\ No newline at end of file
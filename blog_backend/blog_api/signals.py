@@ -0,0 +1,58 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Post, Comment
+from .caching import invalidate_user_profile_cache, bump_posts_version
+
+"""
+Signal handlers that keep cached user profiles and the posts version (post ETags)
+in sync with post, comment and user changes.
+Delete handlers only act on the object being deleted (`origin`), not on rows removed
+by a cascade: the handler for the origin already covers them, and acting per row
+would turn one cascade into a query and cache write per post or comment.
+Cascades from a user delete leave other users' profiles (comment counts) stale
+until their cache entries expire.
+"""
+
+def _author_username(post):
+    # Use the author loaded by select_related or assignment when available
+    if Post.author.is_cached(post):
+        return post.author.username
+    return User.objects.filter(pk=post.author_id).values_list('username', flat=True).first()
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_profile_on_post_change(sender, instance, origin=None, **kwargs):
+    if origin is not None and origin is not instance:
+        return
+    bump_posts_version()
+    username = _author_username(instance)
+    if username:
+        invalidate_user_profile_cache(username)
+
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_profile_on_comment_change(sender, instance, origin=None, **kwargs):
+    # Comments change the comments_count shown on the post author's profile
+    if origin is not None and origin is not instance:
+        return
+    bump_posts_version()
+    if Comment.post.is_cached(instance):
+        username = _author_username(instance.post)
+    else:
+        # Costs one query; CommentListCreateView passes a post with its author loaded to avoid it
+        username = Post.objects.filter(pk=instance.post_id).values_list('author__username', flat=True).first()
+    if username:
+        invalidate_user_profile_cache(username)
+
+@receiver(post_save, sender=User)
+def invalidate_profile_on_user_change(sender, instance, created, update_fields=None, **kwargs):
+    # Usernames and emails appear in post and comment author data; skip new users
+    # and saves that touch neither (e.g. last_login updates)
+    if created or (update_fields is not None and not {'username', 'email'} & set(update_fields)):
+        return
+    bump_posts_version()
+    invalidate_user_profile_cache(instance.username)
+
+@receiver(post_delete, sender=User)
+def invalidate_profile_on_user_delete(sender, instance, **kwargs):
+    bump_posts_version()
+    invalidate_user_profile_cache(instance.username)
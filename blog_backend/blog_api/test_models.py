@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.db.models import Count
 from .models import Post, Comment
 
 class PostModelTest(TestCase):
@@ -26,4 +27,16 @@ class PostModelTest(TestCase):
             content='Test content',
             author=self.user
         )
-        self.assertEqual(str(post), 'Test Post')
\ No newline at end of file
+        self.assertEqual(str(post), 'Test Post')
+
+    def test_comments_count_uses_annotation(self):
+        post = Post.objects.create(
+            title='Test Post',
+            content='Test content',
+            author=self.user
+        )
+        Comment.objects.create(post=post, author=self.user, content='First')
+        annotated = Post.objects.annotate(_comments_count=Count('comments')).get(pk=post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.comments_count, 1)
+        self.assertEqual(post.comments_count, 1)
@@ -1,3 +1,299 @@
+import warnings
 from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from .models import Post, Comment
+from .caching import POSTS_VERSION_KEY
+from .serializers import PostSerializer, PostListSerializer
 
-# Create your tests here.
+class PostListQueryTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        for i in range(5):
+            post = Post.objects.create(
+                title=f'Post {i}',
+                content='Test content',
+                author=self.user
+            )
+            Comment.objects.create(post=post, author=self.user, content='Nice post')
+
+    def test_post_list_query_count_is_constant(self):
+        # ETag aggregates (posts, comments) + count + posts with authors and comment counts
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/posts/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 5)
+        self.assertNotIn('comments', response.data['results'][0])
+        self.assertEqual(response.data['results'][0]['comments_count'], 1)
+
+    def test_post_list_count_query_skips_comment_annotation(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/posts/')
+        count_queries = [q['sql'] for q in queries if 'AS "__count"' in q['sql']]
+        self.assertEqual(len(count_queries), 1)
+        self.assertNotIn('blog_api_comment', count_queries[0])
+
+    def test_post_list_returns_content_preview(self):
+        Post.objects.create(title='Long Post', content='x' * 300, author=self.user)
+        response = self.client.get('/api/posts/')
+        result = response.data['results'][0]
+        self.assertNotIn('content', result)
+        self.assertEqual(result['content_preview'], 'x' * 200 + '...')
+        self.assertEqual(response.data['results'][1]['content_preview'], 'Test content')
+
+    def test_search_query_count_is_constant(self):
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/search/', {'q': 'Post'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(response.data['query'], 'Post')
+        self.assertEqual(response.data['total_pages'], 1)
+
+    def test_empty_search_returns_no_results(self):
+        response = self.client.get('/api/search/', {'q': '  '})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [])
+        self.assertEqual(response.data['count'], 0)
+
+class CachedFieldsSerializerTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(title='Post', content='Test content', author=self.user)
+        Comment.objects.create(post=self.post, author=self.user, content='Nice post')
+
+    def test_instances_get_separate_field_copies(self):
+        first = PostSerializer(self.post)
+        second = PostSerializer(self.post)
+        self.assertIsNot(first.fields['author'], second.fields['author'])
+        self.assertIsNot(first.fields['comments'].child, second.fields['comments'].child)
+        self.assertIs(first.fields['comments'].child.parent, first.fields['comments'])
+
+    def test_nested_data_is_serialized(self):
+        for _ in range(2):
+            data = PostSerializer(self.post).data
+            self.assertEqual(data['author']['username'], 'testuser')
+            self.assertEqual(data['comments'][0]['author']['username'], 'testuser')
+            self.assertEqual(data['comments_count'], 1)
+
+    def test_list_serializer_reuses_author_data(self):
+        other = Post.objects.create(title='Other', content='Test content', author=self.user)
+        serializer = PostListSerializer([self.post, other], many=True)
+        first, second = serializer.data
+        self.assertEqual(first['author'], {'id': self.user.id, 'username': 'testuser', 'email': 'test@example.com'})
+        self.assertIs(first['author'], second['author'])
+
+class CommentAndProfileLookupTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(title='Post', content='Test content', author=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def test_create_comment(self):
+        response = self.client.post(f'/api/posts/{self.post.id}/comments/', {'content': 'Nice post'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.post.comments.count(), 1)
+
+    def test_create_comment_on_missing_post(self):
+        response = self.client.post('/api/posts/999/comments/', {'content': 'Nice post'})
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Comment.objects.exists())
+
+    def test_missing_user_profile(self):
+        response = self.client.get('/api/users/nobody/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_user_profile(self):
+        response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['email'], 'test@example.com')
+        self.assertEqual(response.data['user']['posts_count'], 1)
+        self.assertEqual(response.data['posts']['total_pages'], 1)
+        self.assertFalse(response.data['posts']['has_next'])
+        self.assertFalse(response.data['posts']['has_previous'])
+
+class UserProfileCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(title='Post', content='Test content', author=self.user)
+
+    def test_repeated_profile_requests_hit_cache(self):
+        self.client.get('/api/users/testuser/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['user']['email'])
+
+    def test_new_post_invalidates_cached_profile(self):
+        self.client.get('/api/users/testuser/')
+        Post.objects.create(title='Another Post', content='Test content', author=self.user)
+        response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.data['user']['posts_count'], 2)
+
+    def test_new_comment_invalidates_cached_profile(self):
+        self.client.get('/api/users/testuser/')
+        Comment.objects.create(post=self.post, author=self.user, content='Nice post')
+        response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.data['posts']['results'][0]['comments_count'], 1)
+
+    def test_post_delete_cascade_does_not_signal_per_comment(self):
+        for _ in range(20):
+            Comment.objects.create(post=self.post, author=self.user, content='Nice post')
+        post = Post.objects.select_related('author').get(pk=self.post.pk)
+        # comments lookup + comments delete + post delete; no per-comment signal queries
+        with self.assertNumQueries(3):
+            post.delete()
+
+    def test_create_comment_invalidates_without_extra_query(self):
+        self.client.force_authenticate(user=self.user)
+        # post with author username + comment insert
+        with self.assertNumQueries(2):
+            response = self.client.post(f'/api/posts/{self.post.id}/comments/', {'content': 'Nice post'})
+        self.assertEqual(response.status_code, 201)
+
+    def test_equivalent_page_numbers_share_cache_entry(self):
+        self.client.get('/api/users/testuser/', {'page': '1'})
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/users/testuser/', {'page': '01'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_page_is_not_cached(self):
+        response = self.client.get('/api/users/testuser/', {'page': 'not a page ' * 30})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/api/users/testuser/', {'page': '0'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_arbitrary_username_makes_valid_cache_key(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            response = self.client.get('/api/users/' + 'not a user ' * 30 + '/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_email_update_invalidates_cached_profile(self):
+        self.client.get('/api/users/testuser/')
+        self.client.force_authenticate(user=self.user)
+        self.client.put('/api/profile/update/', {'email': 'new@example.com'})
+        self.client.force_authenticate(user=None)
+        response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.data['posts']['results'][0]['author']['email'], 'new@example.com')
+
+    def test_own_profile_is_not_served_from_cache(self):
+        self.client.get('/api/users/testuser/')
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get('/api/users/testuser/')
+        self.assertEqual(response.data['user']['email'], 'test@example.com')
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(title='Post', content='Test content', author=self.user)
+
+    def test_post_list_not_modified(self):
+        response = self.client.get('/api/posts/')
+        self.assertIn('public', response['Cache-Control'])
+        response = self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_post_list_etag_changes_on_new_comment(self):
+        etag = self.client.get('/api/posts/')['ETag']
+        Comment.objects.create(post=self.post, author=self.user, content='Nice post')
+        response = self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['comments_count'], 1)
+
+    def test_post_list_etag_changes_on_email_update(self):
+        etag = self.client.get('/api/posts/')['ETag']
+        self.client.force_authenticate(user=self.user)
+        self.client.put('/api/profile/update/', {'email': 'new@example.com'})
+        response = self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_list_etag_changes_on_username_change(self):
+        etag = self.client.get('/api/posts/')['ETag']
+        self.user.username = 'renamed'
+        self.user.save()
+        response = self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['author']['username'], 'renamed')
+
+    def test_post_list_etag_changes_on_bulk_update(self):
+        etag = self.client.get('/api/posts/')['ETag']
+        Post.objects.filter(pk=self.post.pk).update(title='Edited')
+        # Bulk updates skip signals and updated_at; the expiring posts version covers them
+        cache.delete(POSTS_VERSION_KEY)
+        response = self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['title'], 'Edited')
+
+    def test_post_detail_etag_changes_on_email_update(self):
+        url = f'/api/posts/{self.post.id}/'
+        etag = self.client.get(url)['ETag']
+        self.client.force_authenticate(user=self.user)
+        self.client.put('/api/profile/update/', {'email': 'new@example.com'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['author']['email'], 'new@example.com')
+
+    def test_post_detail_not_modified(self):
+        url = f'/api/posts/{self.post.id}/'
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.post.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+
+class PostDetailQueryTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(title='Post', content='Test content', author=self.user)
+        Comment.objects.create(post=self.post, author=self.user, content='Nice post')
+        self.client.force_authenticate(user=self.user)
+
+    def test_get_prefetches_comments(self):
+        response = self.client.get(f'/api/posts/{self.post.id}/')
+        self.assertEqual(response.data['comments'][0]['author']['username'], 'testuser')
+
+    def test_delete_does_not_prefetch_comments(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(f'/api/posts/{self.post.id}/')
+        self.assertEqual(response.status_code, 204)
+        # The comment prefetch joins comment rows with their authors
+        self.assertFalse(any(
+            q['sql'].startswith('SELECT "blog_api_comment"') and 'auth_user' in q['sql']
+            for q in queries
+        ))
@@ -25,9 +25,9 @@ urlpatterns = [
     path('posts/<int:post_id>/comments/', views.CommentListCreateView.as_view(), name='comment-list-create'),
     
     # Search
-    path('search/', views.search_posts, name='search-posts'),
+    path('search/', views.SearchPostsView.as_view(), name='search-posts'),
     
     # User Profiles
-    path('users/<str:username>/', views.get_user_profile, name='user-profile'),
+    path('users/<str:username>/', views.UserProfileView.as_view(), name='user-profile'),
     path('profile/update/', views.update_user_profile, name='update-profile'),
 ]
\ No newline at end of file
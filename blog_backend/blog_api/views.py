@@ -4,16 +4,84 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
-from django.db.models import Q
-from django.core.paginator import Paginator
+from django.db import connection, transaction, IntegrityError
+from django.db.models import F, Q, Prefetch, Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Substr
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+import hashlib
 from .models import Post, Comment
-from .serializers import PostSerializer, CommentSerializer
+from .caching import user_profile_cache_key, posts_version, USER_PROFILE_CACHE_TIMEOUT
+from .serializers import PostSerializer, PostListSerializer, CommentSerializer, CONTENT_PREVIEW_LENGTH
 
+def post_queryset():
+    """Posts with author and comment counts loaded up front to avoid N+1 queries"""
+    # A correlated subquery rather than a JOIN + GROUP BY, so pagination's COUNT(*) can drop it
+    comments_count = Comment.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(
+        count=Count('pk')
+    ).values('count')
+    return Post.objects.select_related('author').annotate(
+        _comments_count=Coalesce(Subquery(comments_count), 0)
+    )
+
+def post_list_queryset():
+    """Posts trimmed to the columns PostListSerializer reads, with a content preview instead of the full body"""
+    return post_queryset().only(
+        'id', 'title', 'created_at', 'updated_at',
+        'author', 'author__id', 'author__username', 'author__email'
+    ).annotate(_content_preview=Substr('content', 1, CONTENT_PREVIEW_LENGTH + 1))
+
+def post_detail_queryset():
+    """Posts with their comments and comment authors prefetched for nested serialization"""
+    return post_queryset().defer('search_vector').prefetch_related(
+        Prefetch('comments', queryset=Comment.objects.select_related('author').order_by('created_at'))
+    )
+
+def parse_page_number(value):
+    """Return the page number as a positive int, or None if it isn't one"""
+    try:
+        page_number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return page_number if page_number > 0 else None
+
+def _etag(*parts):
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+def posts_etag(request, *args, **kwargs):
+    """ETag for public post lists; changes when any post, comment or author changes"""
+    posts = Post.objects.aggregate(count=Count('id'), last=Max('updated_at'))
+    comments = Comment.objects.aggregate(count=Count('id'), last=Max('updated_at'))
+    return _etag(posts['count'], posts['last'], comments['count'], comments['last'], posts_version())
+
+def post_detail_etag(request, pk):
+    """ETag for a single post; changes when the post, its comments or their authors change"""
+    post = Post.objects.filter(pk=pk).annotate(
+        comments_total=Count('comments'),
+        last_comment=Max('comments__updated_at')
+    ).values_list('updated_at', 'comments_total', 'last_comment').first()
+    if post is None:
+        return None
+    return _etag(pk, *post, posts_version())
+
+# Browsers revalidate every time (cheap 304s via the ETag); shared caches may reuse for 60s.
+# Last-Modified is not sent because deletions don't move MAX(updated_at).
+public_cache = cache_control(public=True, max_age=0, s_maxage=60)
+
+@method_decorator([public_cache, condition(etag_func=posts_etag)], name='get')
 class PostListCreateView(generics.ListCreateAPIView):
     serializer_class = PostSerializer
     
     def get_queryset(self):
-        return Post.objects.all().order_by('-created_at')
+        return post_list_queryset().order_by('-created_at')
+    
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return PostListSerializer
+        return PostSerializer
     
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -22,30 +90,17 @@ class PostListCreateView(generics.ListCreateAPIView):
     
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
-    
-    def list(self, request, *args, **kwargs):
-        """Custom list method to add pagination info"""
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'results': serializer.data,
-            'count': len(serializer.data),
-            'total_pages': 1,
-            'current_page': 1,
-            'has_next': False,
-            'has_previous': False
-        })
 
+@method_decorator([public_cache, condition(etag_func=post_detail_etag)], name='get')
 class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Post.objects.all()
     serializer_class = PostSerializer
     
+    def get_queryset(self):
+        # Updates clear the prefetch cache and deletes never read comments, so only GET prefetches
+        if self.request.method == 'GET':
+            return post_detail_queryset()
+        return post_queryset()
+    
     def get_permissions(self):
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             return [IsAuthenticated()]
@@ -60,37 +115,18 @@ class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
         return post
 
 class UserPostListView(generics.ListAPIView):
-    serializer_class = PostSerializer
+    serializer_class = PostListSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Post.objects.filter(author=self.request.user).order_by('-created_at')
-    
-    def list(self, request, *args, **kwargs):
-        """Custom list method to add pagination info"""
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'results': serializer.data,
-            'count': len(serializer.data),
-            'total_pages': 1,
-            'current_page': 1,
-            'has_next': False,
-            'has_previous': False
-        })
+        return post_list_queryset().filter(author=self.request.user).order_by('-created_at')
 
 class CommentListCreateView(generics.ListCreateAPIView):
     serializer_class = CommentSerializer
     
     def get_queryset(self):
         post_id = self.kwargs['post_id']
-        return Comment.objects.filter(post_id=post_id).order_by('created_at')
+        return Comment.objects.select_related('author').filter(post_id=post_id).order_by('created_at')
     
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -99,76 +135,84 @@ class CommentListCreateView(generics.ListCreateAPIView):
     
     def perform_create(self, serializer):
         post_id = self.kwargs['post_id']
-        try:
-            post = Post.objects.get(id=post_id)
-            serializer.save(author=self.request.user, post=post)
-        except Post.DoesNotExist:
+        # Only the author's username is loaded, for the profile cache invalidation in signals
+        post = Post.objects.select_related('author').only(
+            'id', 'author', 'author__username'
+        ).filter(pk=post_id).first()
+        if post is None:
             from rest_framework.exceptions import NotFound
             raise NotFound("Post not found")
+        serializer.save(author=self.request.user, post=post)
 
-@api_view(['GET'])
-def search_posts(request):
+@method_decorator([public_cache, condition(etag_func=posts_etag)], name='get')
+class SearchPostsView(generics.ListAPIView):
     """Search posts by title and content"""
-    query = request.GET.get('q', '').strip()
-    
-    if not query:
-        return Response({'results': [], 'count': 0})
+    serializer_class = PostListSerializer
     
-    posts = Post.objects.filter(
-        Q(title__icontains=query) | Q(content__icontains=query)
-    ).order_by('-created_at')
-    
-    paginator = Paginator(posts, 10)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
-    
-    serializer = PostSerializer(page_obj, many=True)
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '').strip()
+        if not query:
+            return Post.objects.none()
+        
+        substring_match = Q(title__icontains=query) | Q(content__icontains=query)
+        if connection.vendor == 'postgresql':
+            # Full-text matches are ranked first; substring matches keep partial words findable
+            search_query = SearchQuery(query, config='english', search_type='websearch')
+            return post_list_queryset().annotate(
+                rank=SearchRank(F('search_vector'), search_query)
+            ).filter(
+                Q(search_vector=search_query) | substring_match
+            ).order_by('-rank', '-created_at')
+        return post_list_queryset().filter(substring_match).order_by('-created_at')
     
-    return Response({
-        'results': serializer.data,
-        'count': paginator.count,
-        'total_pages': paginator.num_pages,
-        'current_page': page_obj.number,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
-        'query': query
-    })
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data['query'] = request.query_params.get('q', '').strip()
+        return response
 
-@api_view(['GET'])
-def get_user_profile(request, username):
+class UserProfileView(generics.ListAPIView):
     """Get user profile with their posts"""
-    try:
-        user = User.objects.get(username=username)
-        posts = Post.objects.filter(author=user).order_by('-created_at')
+    serializer_class = PostListSerializer
+    
+    def list(self, request, username):
+        page_number = parse_page_number(request.query_params.get('page', 1))
+        # The owner's own view includes their email, so only other viewers share the cache.
+        # Invalid page numbers are left to the paginator (404) and never reach the cache.
+        is_own_profile = request.user.is_authenticated and request.user.username == username
+        cache_key = None
+        if not is_own_profile and page_number is not None:
+            cache_key = user_profile_cache_key(username, page_number)
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data)
         
-        paginator = Paginator(posts, 10)
-        page_number = request.GET.get('page', 1)
-        page_obj = paginator.get_page(page_number)
+        user = User.objects.filter(username=username).values(
+            'id', 'username', 'email', 'date_joined'
+        ).first()
+        if user is None:
+            return Response(
+                {'error': 'User not found'}, 
+                status=status.HTTP_404_NOT_FOUND
+            )
+        posts = post_list_queryset().filter(author_id=user['id']).order_by('-created_at')
         
-        posts_serializer = PostSerializer(page_obj, many=True)
+        page = self.paginate_queryset(posts)
+        serializer = self.get_serializer(page, many=True)
+        posts_data = self.paginator.get_paginated_data(serializer.data)
         
-        return Response({
+        data = {
             'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email if request.user == user else None,
-                'date_joined': user.date_joined,
-                'posts_count': posts.count()
+                'id': user['id'],
+                'username': user['username'],
+                'email': user['email'] if request.user.id == user['id'] else None,
+                'date_joined': user['date_joined'],
+                'posts_count': posts_data['count']
             },
-            'posts': {
-                'results': posts_serializer.data,
-                'count': paginator.count,
-                'total_pages': paginator.num_pages,
-                'current_page': page_obj.number,
-                'has_next': page_obj.has_next(),
-                'has_previous': page_obj.has_previous()
-            }
-        })
-    except User.DoesNotExist:
-        return Response(
-            {'error': 'User not found'}, 
-            status=status.HTTP_404_NOT_FOUND
-        )
+            'posts': posts_data
+        }
+        if cache_key is not None:
+            cache.set(cache_key, data, USER_PROFILE_CACHE_TIMEOUT)
+        return Response(data)
 
 @api_view(['PUT'])
 @permission_classes([IsAuthenticated])
@@ -178,13 +222,17 @@ def update_user_profile(request):
     email = request.data.get('email')
     
     if email:
-        if User.objects.filter(email=email).exclude(id=user.id).exists():
+        # Uniqueness is enforced by the auth_user_email_unique index
+        user.email = email
+        try:
+            # The User post_save signal refreshes the post ETags and cached profile
+            with transaction.atomic():
+                user.save(update_fields=['email'])
+        except IntegrityError:
             return Response(
                 {'error': 'Email already taken'}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
-        user.email = email
-        user.save()
     
     return Response({
         'user': {
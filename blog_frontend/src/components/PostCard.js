@@ -10,6 +10,7 @@ import { Link } from 'react-router-dom';
  * @param {number} props.post.id - Unique identifier for the post
  * @param {string} props.post.title - Title of the post
  * @param {string} props.post.content - Content/body of the post
+ * @param {string} [props.post.content_preview] - Truncated content returned by list endpoints
  * @param {string} props.post.created_at - ISO date string when post was created
  * @param {number} props.post.comments_count - Number of comments on the post
  * @param {Object} props.post.author - Author information object
@@ -71,7 +72,7 @@ const PostCard = ({ post, showActions = false, onEdit, onDelete }) => {
 
   const authorName = post.author?.username || 'Unknown Author';
   const postTitle = post.title || 'Untitled Post';
-  const postContent = post.content || '';
+  const postContent = post.content_preview || post.content || '';
   const commentsCount = post.comments_count || 0;
 
   return (